@@ -1,11 +1,13 @@
 import asyncio
 import os
+import sys
 import re
 import csv
-import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from find_contact_email import get_company_info_from_seedtable, get_browser_config, get_llm_strategy, scan_page_for_emails, extract_links_from_page
+from find_contact_email import get_company_info_from_seedtable, get_browser_config, get_llm_strategy, scan_page_for_emails, extract_links_from_page, scan_contact_links, get_session, close_session, canonical_url
+from utils.concurrency_utils import make_session_pool, run
 
 from crawl4ai import (
     AsyncWebCrawler, 
@@ -38,6 +40,16 @@ COUNTRIES = [
     "Sweden"
 ]
 
+# Selectors used on every company profile of a list page, compiled once instead of per call.
+# The profile selector is a substring match on the class attribute, like the old class_ predicate,
+# so variants such as 'hover:border-gray-300 border rounded-lg' are still picked up
+COMPANY_PROFILE_SELECTOR = sv.compile('div[class*="border-gray-300 border rounded-lg"]')
+COMPANY_NAME_SELECTOR = sv.compile('h3.text-2xl.font-bold')
+COMPANY_LINK_SELECTOR = sv.compile('a[href*="/startups/"]')
+
+# Maximum number of companies crawled at the same time; each one holds its own crawler session
+COMPANY_CONCURRENCY = 8
+
 def get_country_url(country: str) -> str:
     """
     Convert country name to SeedTable URL format.
@@ -52,7 +64,7 @@ def get_country_url(country: str) -> str:
     country_url_part = country.lower().replace(" ", "-")
     return f"https://www.seedtable.com/best-ai-startups-in-{country_url_part}"
 
-def extract_company_links(url: str, country: str) -> List[Dict[str, Any]]:
+async def extract_company_links(url: str, country: str) -> List[Dict[str, Any]]:
     """
     Extract all company links from the SeedTable list page.
     
@@ -65,76 +77,99 @@ def extract_company_links(url: str, country: str) -> List[Dict[str, Any]]:
     """
     print(f"Fetching startups list from: {url}")
     
-    companies = []
-    
     try:
-        response = requests.get(url)
-        if response.status_code != 200:
-            print(f"Failed to access SeedTable list page: {url}")
-            return companies
+        session = await get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                print(f"Failed to access SeedTable list page: {url}")
+                return []
+            content = await response.read()
         
-        # Parse the HTML with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Parse off the event loop so the companies of the current country keep crawling meanwhile
+        return await asyncio.to_thread(parse_company_links, content, country)
         
-        # Find all company profile containers - more generic approach
-        company_profiles = soup.find_all('div', class_=lambda c: c and 'border-gray-300 border rounded-lg' in c)
-        print(f"Found {len(company_profiles)} company profiles on the page")
+    except Exception as e:
+        print(f"Error fetching companies list for {country}: {e}")
+        return []
+
+def parse_company_links(content: bytes, country: str) -> List[Dict[str, Any]]:
+    """
+    Parse the company links out of a SeedTable list page.
+    
+    Args:
+        content: The raw HTML of the list page
+        country: The country name for these companies
         
-        for profile in company_profiles:
-            # Look for the company name heading and link
-            name_link = profile.select_one('h3.text-2xl.font-bold')
+    Returns:
+        A list of dictionaries with company name, country and link to their SeedTable page
+    """
+    # Companies keyed by ID, so duplicate links to the same company collapse as they are found
+    companies: Dict[str, Dict[str, Any]] = {}
+    total_links = 0
+    
+    # Parse the HTML with BeautifulSoup on top of the lxml C parser
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # Find all company profile containers - more generic approach
+    company_profiles = COMPANY_PROFILE_SELECTOR.select(soup)
+    print(f"Found {len(company_profiles)} company profiles on the page")
+    
+    for profile in company_profiles:
+        # Look for the company name heading and link
+        name_link = COMPANY_NAME_SELECTOR.select_one(profile)
+        
+        if name_link:
+            # Try to find the parent 'a' tag that contains the link to the company profile
+            parent_a = name_link.find_parent('a')
             
-            if name_link:
-                # Try to find the parent 'a' tag that contains the link to the company profile
-                parent_a = name_link.find_parent('a')
+            if parent_a and 'href' in parent_a.attrs and '/startups/' in parent_a['href']:
+                company_name = name_link.get_text().strip()
+                company_url = parent_a['href']
+                company_id = sys.intern(company_url.rsplit('/', 1)[-1])  # Get the company ID from the URL
                 
-                if parent_a and 'href' in parent_a.attrs and '/startups/' in parent_a['href']:
-                    company_name = name_link.get_text().strip()
-                    company_url = parent_a['href']
-                    company_id = company_url.split('/')[-1]  # Get the company ID from the URL
+                # Add to our list with country information
+                total_links += 1
+                companies.setdefault(company_id, {
+                    "name": company_name,
+                    "id": company_id,
+                    "country": country
+                })
+        else:
+            # Alternative approach: look directly for links to company profiles.
+            # iselect yields matches lazily, so the break below stops the search at the first usable link
+            for link in COMPANY_LINK_SELECTOR.iselect(profile):
+                # Extract the link text once; get_text walks every descendant of the link
+                company_name = link.get_text().strip()
+                if company_name:
+                    company_url = link['href']
+                    company_id = sys.intern(company_url.rsplit('/', 1)[-1])  # Get the company ID
                     
-                    # Add to our list with country information
-                    companies.append({
-                        "name": company_name,
-                        "id": company_id,
-                        "country": country
-                    })
-                    print(f"Found company: {company_name} (ID: {company_id}, Country: {country})")
-            else:
-                # Alternative approach: look directly for links to company profiles
-                company_links = profile.select('a[href*="/startups/"]')
-                for link in company_links:
-                    if link.get_text().strip():
-                        company_name = link.get_text().strip()
-                        company_url = link['href']
-                        company_id = company_url.split('/')[-1]  # Get the company ID
-                        
-                        # Only add if this is likely the main company link (contains title)
-                        # This helps avoid duplicates when there are multiple links to the same company
-                        if len(company_name) > 1:  # Avoid empty or single character links
-                            companies.append({
-                                "name": company_name,
-                                "id": company_id,
-                                "country": country
-                            })
-                            print(f"Found company (alt method): {company_name} (ID: {company_id}, Country: {country})")
-                            # Once found, break to avoid duplicates from the same profile
-                            break
-        
-        # Remove any duplicates (by ID)
-        unique_companies = []
-        seen_ids = set()
-        for company in companies:
-            if company["id"] not in seen_ids:
-                seen_ids.add(company["id"])
-                unique_companies.append(company)
-        
-        print(f"Found {len(unique_companies)} unique companies out of {len(companies)} total links in {country}")
-        return unique_companies
+                    # Only add if this is likely the main company link (contains title)
+                    # This helps avoid duplicates when there are multiple links to the same company
+                    if len(company_name) > 1:  # Avoid empty or single character links
+                        total_links += 1
+                        companies.setdefault(company_id, {
+                            "name": company_name,
+                            "id": company_id,
+                            "country": country
+                        })
+                        # Once found, break to avoid duplicates from the same profile
+                        break
+    
+    print(f"Found {len(companies)} unique companies out of {total_links} total links in {country}")
+    return list(companies.values())
+
+def prefetch_company_links(country: str) -> asyncio.Task:
+    """
+    Start fetching the SeedTable list page for a country in the background.
+    
+    Args:
+        country: The country name to fetch companies for
         
-    except Exception as e:
-        print(f"Error fetching companies list for {country}: {e}")
-        return companies
+    Returns:
+        A task resolving to the result of extract_company_links for that country
+    """
+    return asyncio.create_task(extract_company_links(get_country_url(country), country))
 
 async def process_company(crawler, company_data: Dict[str, Any], session_id: str, llm_strategy) -> Dict[str, Any]:
     """
@@ -150,23 +185,26 @@ async def process_company(crawler, company_data: Dict[str, Any], session_id: str
         A dictionary with company information including name, website, LinkedIn URL, and emails
     """
     # Get company information from SeedTable
-    company_info = get_company_info_from_seedtable(company_data["id"])
+    company_info = await get_company_info_from_seedtable(company_data["id"])
     
-    # Add country to company info
+    # Add country and SeedTable ID to company info
     company_info["country"] = company_data["country"]
+    company_info["id"] = company_data["id"]
     
     if not company_info["websites"]:
         print(f"No website found for {company_info['name']} ({company_info['country']}). Skipping.")
         return company_info
     
     visited_urls = set()
+    # Collect into a set so repeated addresses across pages are deduplicated as they arrive
+    found_emails: Set[str] = set(company_info["emails"])
     
     # Check each website in the list if multiple are available
     for website in company_info["websites"]:
         print(f"\nChecking company website: {website}")
-        main_page_emails = await scan_page_for_emails(crawler, website, session_id, llm_strategy)
-        company_info["emails"].extend(main_page_emails)
-        visited_urls.add(website)
+        main_page_emails = await scan_page_for_emails(crawler, website, session_id, llm_strategy, with_links=True)
+        found_emails.update(main_page_emails)
+        visited_urls.add(canonical_url(website))
         
         if main_page_emails:
             print(f"Found emails on main page: {main_page_emails}")
@@ -175,32 +213,14 @@ async def process_company(crawler, company_data: Dict[str, Any], session_id: str
         
         # Extract and follow potentially useful links
         links_to_check, mailto_emails = await extract_links_from_page(crawler, website, session_id)
-        company_info["emails"].extend(mailto_emails)  # Add emails from mailto links
+        found_emails.update(mailto_emails)  # Add emails from mailto links
         print(f"Found {len(links_to_check)} potential contact links to check")
         
-        for link_data in links_to_check:
-            link_url = link_data["url"]
-            link_text = link_data["text"]
-            
-            # Skip invalid URLs or already visited URLs
-            if link_url in visited_urls or link_url.startswith('mailto:'):
-                continue
-                
-            print(f"Checking link: '{link_text}' at {link_url}")
-            visited_urls.add(link_url)
-            
-            # Pause between requests
-            await asyncio.sleep(1)
-            
-            # Check the linked page for emails
-            link_emails = await scan_page_for_emails(crawler, link_url, session_id, llm_strategy)
-            
-            if link_emails:
-                print(f"Found emails on page '{link_text}': {link_emails}")
-                company_info["emails"].extend(link_emails)
+        # Contact pages all live on the company's own site; scan_contact_links keeps the load on it polite
+        found_emails.update(await scan_contact_links(crawler, links_to_check, visited_urls, llm_strategy))
     
-    # Remove duplicate emails
-    company_info["emails"] = list(set(company_info["emails"]))
+    # Sort once so the output is stable between runs
+    company_info["emails"] = sorted(found_emails)
     
     return company_info
 
@@ -208,73 +228,119 @@ async def process_all_countries():
     """Process AI startups across all countries."""
     # Create a CSV file to store all contact information
     output_file = "european_ai_startups_contact_info.csv"
+    processed_count = 0
     
-    # Initialize master list to collect all company data
-    all_companies_data = []
+    # Companies saved by an earlier, interrupted run are skipped if the user wants to resume
+    processed_ids = load_processed_ids(output_file)
+    if processed_ids:
+        response = input(f"Found {len(processed_ids)} companies in {output_file}. Resume processing from where we left off? [y/n]: ")
+        if response.lower() not in ['y', 'yes']:
+            print("Starting from the beginning (existing file will be overwritten)...")
+            processed_ids = set()
+        else:
+            print(f"Resuming processing (skipping {len(processed_ids)} already processed companies)...")
     
     # Set up the crawler
     browser_config = get_browser_config()
     llm_strategy = get_llm_strategy()
-    session_id = "email_finder_session"
     
-    # Process each country
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        for country in COUNTRIES:
-            country_url = get_country_url(country)
-            print(f"\n{'='*50}\nProcessing country: {country}\n{'='*50}")
-            
-            # Get companies for this country
-            country_companies = extract_company_links(country_url, country)
-            
-            if not country_companies:
-                print(f"No companies found for {country}. Moving to next country.")
-                continue
-            
-            print(f"\nFound {len(country_companies)} companies in {country} to process.")
+    # Each concurrent company takes its own crawler session; the pool size caps how many run at once
+    session_ids = make_session_pool(COMPANY_CONCURRENCY)
+    
+    # Open the output once and append each company as it finishes; line buffering
+    # keeps every finished row on disk in case of script interruption
+    mode = "a" if processed_ids else "w"
+    with open(output_file, mode, newline='', encoding='utf-8', buffering=1) as f:
+        writer = csv.writer(f)
+        if mode == "w":
+            writer.writerow(CSV_HEADER)
+        
+        # Process each country
+        async with AsyncWebCrawler(config=browser_config) as crawler:
+            # The list page of the next country is fetched while the current country is crawled
+            next_country_companies = prefetch_company_links(COUNTRIES[0])
             
-            # Process each company in this country
-            for i, company in enumerate(country_companies):
-                print(f"\n[{country}: {i+1}/{len(country_companies)}] Processing company: {company['name']}")
+            for index, country in enumerate(COUNTRIES):
+                print(f"\n{'='*50}\nProcessing country: {country}\n{'='*50}")
                 
-                try:
-                    # Process the company and get its information
-                    company_info = await process_company(crawler, company, session_id, llm_strategy)
-                    
-                    # Add to our master list
+                # Get companies for this country
+                country_companies = await next_country_companies
+                if index + 1 < len(COUNTRIES):
+                    next_country_companies = prefetch_company_links(COUNTRIES[index + 1])
+                
+                if processed_ids:
+                    country_companies = [company for company in country_companies if company["id"] not in processed_ids]
+                
+                if not country_companies:
+                    print(f"No companies left to process for {country}. Moving to next country.")
+                    continue
+                
+                print(f"\nFound {len(country_companies)} companies in {country} to process.")
+                
+                async def process_country_company(i, company):
+                    session_id = await session_ids.get()
+                    try:
+                        print(f"\n[{country}: {i+1}/{len(country_companies)}] Processing company: {company['name']}")
+                        return company, await process_company(crawler, company, session_id, llm_strategy)
+                    except Exception as e:
+                        print(f"Error processing {company['name']} ({company['country']}): {e}")
+                        return company, None
+                    finally:
+                        session_ids.put_nowait(session_id)
+                
+                # Process the companies of this country concurrently and save each one as soon as it finishes
+                tasks = [process_country_company(i, company) for i, company in enumerate(country_companies)]
+                for next_done in asyncio.as_completed(tasks):
+                    company, company_info = await next_done
                     if company_info:
-                        all_companies_data.append(company_info)
+                        writer.writerow(company_to_csv_row(company_info))
+                        processed_count += 1
                         print(f"Processed {company['name']} ({company['country']}) successfully. Found {len(company_info['emails'])} email(s).")
-                    
-                except Exception as e:
-                    print(f"Error processing {company['name']} ({company['country']}): {e}")
-                
-                # Save progress after each company (in case of script interruption)
-                save_progress_to_csv(all_companies_data, output_file)
     
-    # Final save of all data
-    save_progress_to_csv(all_companies_data, output_file)
-    print(f"\nAll countries processed. Results saved to {output_file}")
+    print(f"\nAll countries processed. {processed_count} companies saved to {output_file}")
 
-def save_progress_to_csv(companies_data: List[Dict[str, Any]], filename: str):
-    """Save the current progress to CSV file."""
-    with open(filename, "w", newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(["country", "name", "website", "linkedin", "email"])
+# Column order of the contact info CSV, matching company_to_csv_row
+CSV_HEADER = ["country", "name", "website", "linkedin", "email", "seedtable_id"]
+
+def company_to_csv_row(company: Dict[str, Any]) -> List[str]:
+    """Format a processed company as a row for the contact info CSV."""
+    return [
+        company["country"],
+        company["name"],
+        ",".join(company["websites"]),
+        company["linkedin"] or "",
+        ",".join(company["emails"]),
+        company["id"]
+    ]
+
+def load_processed_ids(output_file: str) -> Set[str]:
+    """
+    Read the SeedTable IDs of the companies already saved to the contact info CSV.
+    
+    Args:
+        output_file: Path of the contact info CSV
         
-        for company in companies_data:
-            websites_str = ",".join(company["websites"]) if company["websites"] else ""
-            emails_str = ",".join(company["emails"]) if company["emails"] else ""
-            
-            writer.writerow([
-                company["country"],
-                company["name"],
-                websites_str,
-                company["linkedin"] or "",
-                emails_str
-            ])
+    Returns:
+        The saved company IDs, empty if the file is missing or was written without IDs
+    """
+    if not os.path.exists(output_file):
+        return set()
+    
+    try:
+        with open(output_file, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or "seedtable_id" not in reader.fieldnames:
+                return set()
+            return {row["seedtable_id"] for row in reader if row.get("seedtable_id")}
+    except Exception as e:
+        print(f"Error reading existing output file {output_file}: {e}")
+        return set()
 
 async def main():
-    await process_all_countries()
+    try:
+        await process_all_countries()
+    finally:
+        await close_session()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
@@ -1,5 +1,5 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 def analyze_seedtable_page(company_id):
     """
@@ -15,10 +15,39 @@ def analyze_seedtable_page(company_id):
             return
             
         # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
+        
+        # Collect everything the strategies below need in a single walk of the document
+        overview_section = None
+        overview_last = None
+        in_overview = False
+        overview_links = []
+        websites_span = None
+        website_elements = []
+        
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                if overview_section is None and node.name == 'div' and \
+                        any('bg-st-gray-lightest' in c for c in node.get('class', [])):
+                    # The overview subtree ends at its deepest last descendant
+                    overview_section = overview_last = node
+                    while getattr(overview_last, 'contents', None):
+                        overview_last = overview_last.contents[-1]
+                    in_overview = True
+                elif in_overview and node.name == 'a':
+                    overview_links.append(node)
+                elif websites_span is None and node.name == 'span' and node.string == 'Websites:':
+                    websites_span = node
+            else:
+                # Strategy 2 input: any text mentioning 'website' or 'url'
+                lowered = node.lower()
+                if 'website' in lowered or 'url' in lowered:
+                    website_elements.append(node)
+            
+            if node is overview_last:
+                in_overview = False
         
         # Look for overview section
-        overview_section = soup.find('div', class_=lambda c: c and 'bg-st-gray-lightest' in c)
         if not overview_section:
             print("Could not find overview section")
             return
@@ -32,7 +61,6 @@ def analyze_seedtable_page(company_id):
         # Try different strategies to find website links
         
         # Strategy 1: Look for span with "Websites:" text
-        websites_span = soup.find('span', string='Websites:')
         if websites_span:
             print("\nFound 'Websites:' span element")
             parent_li = websites_span.find_parent('li')
@@ -49,7 +77,6 @@ def analyze_seedtable_page(company_id):
             print("\nNo 'Websites:' span element found")
             
         # Strategy 2: Look for any elements with 'website' or 'url' in the text
-        website_elements = soup.find_all(text=lambda text: text and ('website' in text.lower() or 'url' in text.lower()))
         if website_elements:
             print("\nFound elements containing 'website' or 'url':")
             for elem in website_elements:
@@ -64,10 +91,9 @@ def analyze_seedtable_page(company_id):
                             print(f"      {link.get('href')}")
         
         # Strategy 3: Find all links in the overview section
-        all_links = overview_section.find_all('a')
-        if all_links:
+        if overview_links:
             print("\nAll links in overview section:")
-            for link in all_links:
+            for link in overview_links:
                 href = link.get('href')
                 text = link.get_text().strip()
                 print(f"  - {text}: {href}")
@@ -30,18 +30,28 @@ def consolidate_csv_files(output_csv: str = "european_startup_websites.csv") ->
     
     print(f"Found {len(csv_files)} country CSV files to process")
     
-    # Track unique companies to avoid duplicates
-    unique_companies = {}  # website_url -> {name, country, eu_startups_url, website_url}
+    # Only website URLs are remembered; rows are written as soon as they are final
+    seen_urls: Set[str] = set()
+    # Records missing a name or EU-Startups URL wait here in case a duplicate fills the gap
+    incomplete_companies: Dict[str, Dict[str, str]] = {}
+    written_count = 0
     
-    # Process each CSV file
-    for csv_file in csv_files:
-        country_name = os.path.basename(csv_file).split('_')[0]
-        print(f"Processing {country_name} from {csv_file}")
+    # Create the output CSV file and write header
+    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        fieldnames = ['name', 'country', 'eu_startups_url', 'website_url']
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
         
-        try:
-            with open(csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                country_companies = list(reader)
+        # Country files are processed in name order so the output stays grouped by country
+        for csv_file in sorted(csv_files):
+            country_name = os.path.basename(csv_file).split('_')[0]
+            print(f"Processing {country_name} from {csv_file}")
+            
+            try:
+                with open(csv_file, 'r', encoding='utf-8') as file:
+                    reader = csv.DictReader(file)
+                    # A single country file is small, so sort it by name for readability
+                    country_companies = sorted(reader, key=lambda c: c.get('name') or '')
                 
                 print(f"Found {len(country_companies)} companies in {country_name}")
                 
@@ -53,50 +63,42 @@ def consolidate_csv_files(output_csv: str = "european_startup_websites.csv") ->
                     if not website_url:
                         continue
                     
-                    # Use website_url as deduplication key
-                    if website_url in unique_companies:
-                        # If duplicate found, keep the one with more information
-                        existing = unique_companies[website_url]
-                        if (not existing.get('name') and company.get('name')) or \
-                           (not existing.get('eu_startups_url') and company.get('eu_startups_url')):
-                            unique_companies[website_url] = {
-                                'name': company.get('name', ''),
-                                'country': company.get('country', country_name),
-                                'eu_startups_url': company.get('eu_startups_url', ''),
-                                'website_url': website_url
-                            }
-                        continue
-                    
-                    # Add to unique companies
-                    unique_companies[website_url] = {
+                    record = {
                         'name': company.get('name', ''),
                         'country': company.get('country', country_name),
                         'eu_startups_url': company.get('eu_startups_url', ''),
                         'website_url': website_url
                     }
-        except Exception as e:
-            print(f"Error processing CSV file {csv_file}: {e}")
-    
-    # Convert to list for easier processing
-    companies_list = list(unique_companies.values())
-    
-    print(f"Found {len(companies_list)} unique companies across all countries")
-    
-    # Sort by country and then by name for better readability
-    companies_list.sort(key=lambda x: (x['country'], x['name']))
-    
-    # Create the output CSV file and write header
-    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['name', 'country', 'eu_startups_url', 'website_url']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+                    
+                    # Use website_url as deduplication key
+                    if website_url in seen_urls:
+                        # A duplicate only matters if it adds information to a held-back record
+                        existing = incomplete_companies.get(website_url)
+                        if existing is None or not (
+                            (not existing['name'] and record['name']) or
+                            (not existing['eu_startups_url'] and record['eu_startups_url'])
+                        ):
+                            continue
+                    else:
+                        seen_urls.add(website_url)
+                    
+                    if record['name'] and record['eu_startups_url']:
+                        # Complete records can never be replaced, so write them immediately
+                        incomplete_companies.pop(website_url, None)
+                        writer.writerow(record)
+                        written_count += 1
+                    else:
+                        incomplete_companies[website_url] = record
+            except Exception as e:
+                print(f"Error processing CSV file {csv_file}: {e}")
         
-        # Write each unique company to CSV
-        for company in companies_list:
-            writer.writerow(company)
+        # Records that never met a more complete duplicate are written last
+        writer.writerows(incomplete_companies.values())
+        written_count += len(incomplete_companies)
     
+    print(f"Found {written_count} unique companies across all countries")
     print(f"Successfully created consolidated CSV file: {output_csv}")
-    print(f"Total unique companies: {len(companies_list)}")
+    print(f"Total unique companies: {written_count}")
 
 if __name__ == "__main__":
     import argparse
@@ -4,10 +4,16 @@ import re
 import sys
 import csv
 import time
-import requests
+import json
+import string
+import aiohttp
 from typing import List, Set, Dict, Any, Optional, Tuple
 import urllib.parse
-from bs4 import BeautifulSoup
+import copy
+import contextlib
+import functools
+from collections import OrderedDict
+from bs4 import BeautifulSoup, SoupStrainer
 import glob
 
 # Fix console encoding for Windows
@@ -24,6 +30,9 @@ from crawl4ai import (
     LLMExtractionStrategy
 )
 
+from utils.cache_utils import EmailCache
+from utils.concurrency_utils import AdaptiveLimiter, make_session_pool, run
+
 from config import (
     SEEDTABLE_BASE_URL,
     PAYHAWK_CSS_SELECTOR as CSS_SELECTOR, 
@@ -32,35 +41,126 @@ from config import (
     OPENROUTER_MODEL
 )
 
-# Regular expression for finding email addresses
-EMAIL_REGEX = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+# Regular expression for finding email addresses.
+# The lookbehind only lets a match start at the beginning of a run of local-part characters,
+# so a long run without an '@' is scanned once instead of once per starting position.
+EMAIL_REGEX = r'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+
+# Patterns used on every crawled page, compiled once at import
+EMAIL_RE = re.compile(EMAIL_REGEX)
+MAILTO_RE = re.compile(r'mailto:([^?]+)')
+# Addresses of every mailto link in a page, stopping at the query string or the end of the attribute
+MAILTO_HTML_RE = re.compile(r'mailto:([^?"\'\s<>]+)')
+
+# Characters allowed in the local part of EMAIL_REGEX, used to find where a match can start
+EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+
+# Contact keywords lowercased once for case-insensitive link matching
+CONTACT_KEYWORDS_LOWER = tuple(keyword.lower() for keyword in CONTACT_KEYWORDS)
+# All keywords as one alternation so each link is checked with a single regex search
+CONTACT_KEYWORDS_RE = re.compile('|'.join(map(re.escape, CONTACT_KEYWORDS_LOWER)))
+
+# Spelled-out forms of "@" that only the LLM pass can recover
+OBFUSCATED_AT_HINTS = ('[at]', '(at)', '{at}')
+
+# Maximum number of companies crawled at the same time by process_country_csv_files
+COMPANY_CONCURRENCY = 8
+
+# Concurrency process_consolidated_csv starts from before adapting towards --workers
+ADAPTIVE_INITIAL_WORKERS = 4
+
+# Maximum number of finished rows process_consolidated_csv writes per batch
+CSV_WRITE_BATCH = 64
+
+# Output buffer size and how many finished rows are written between explicit flushes
+CSV_WRITE_BUFFER = 1 << 20
+CSV_FLUSH_EVERY = 64
+
+# Maximum number of contact pages crawled at the same time for one website
+LINK_CONCURRENCY = 4
+
+# Contact pages checked per company by find_emails_for_company
+MAX_CONTACT_PAGES = 3
+
+# Link extraction only needs anchors, so the parser skips building the rest of the tree
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+# File extensions to exclude from email results (a tuple so str.endswith can check them all at once)
+EXCLUDED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico', '.pdf', '.doc', '.docx')
+
+# In-memory LRU caches so a batch run never crawls the same page or SeedTable entry twice
+MAX_CACHE_ENTRIES = 10000
+# Page URL -> {'emails', 'links', 'mailto'} found by the last complete scan of that page
+page_cache: "OrderedDict[str, Dict[str, List[Any]]]" = OrderedDict()
+seedtable_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+# Guessed URLs -> whether they answered, since companies with similar names retry the same guesses
+probe_cache: "OrderedDict[str, bool]" = OrderedDict()
+# Probes still running, so concurrent lookups of the same guess share one request,
+# and how many lookups are waiting on each (the probe is cancelled when none are left)
+probes_in_flight: Dict[str, "asyncio.Task[bool]"] = {}
+probe_waiters: Dict[str, int] = {}
 
-# List of file extensions to exclude from email results
-EXCLUDED_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico', '.pdf', '.doc', '.docx']
+# On-disk page cache so re-runs skip pages scanned recently; opened by main() when running from the CLI
+email_cache: Optional[EmailCache] = None
+
+def cache_get(cache: OrderedDict, key: str) -> Optional[Any]:
+    """Return a cached value and mark it as recently used, or None if missing."""
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+def cache_put(cache: OrderedDict, key: str, value: Any) -> None:
+    """Store a value, evicting the least recently used entry when the cache is full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > MAX_CACHE_ENTRIES:
+        cache.popitem(last=False)
+
+# Shared aiohttp session for SeedTable pages and domain probes, created on first use inside the event loop
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it with a pooled connector on first use."""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        )
+    return _aiohttp_session
+
+async def close_session() -> None:
+    """Close the shared aiohttp session if it was opened."""
+    global _aiohttp_session
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
 
 def is_valid_email(email: str) -> bool:
     """Check if an email is valid and not a filename with excluded extension."""
     if not email:
         return False
         
-    # Check if the email ends with any excluded extension
-    for ext in EXCLUDED_EXTENSIONS:
-        if email.lower().endswith(ext):
-            return False
+    # Check if the email ends with any excluded extension (one endswith call over the tuple)
+    if email.lower().endswith(EXCLUDED_EXTENSIONS):
+        return False
     
-    # Additional validation could be added here
-    return True
+    # Require a local part and a dotted domain, which rules out placeholders like "{{email}}"
+    local_part, _, domain = email.rpartition('@')
+    return bool(local_part) and '.' in domain.strip('.')
 
+@functools.lru_cache(maxsize=1)
 def get_browser_config() -> BrowserConfig:
-    """Returns the browser configuration for the crawler."""
+    """Returns the browser configuration for the crawler, built once per process."""
     return BrowserConfig(
         browser_type="chromium",
         headless=True,  # Run in headless mode for better performance
         verbose=True,
     )
 
+@functools.lru_cache(maxsize=1)
 def get_llm_strategy() -> LLMExtractionStrategy:
-    """Returns the LLM extraction strategy configuration."""
+    """Returns the LLM extraction strategy configuration, shared by every caller in the process."""
     return LLMExtractionStrategy(
         provider="openrouter",
         api_token=OPENROUTER_API_KEY,
@@ -75,18 +175,213 @@ def get_llm_strategy() -> LLMExtractionStrategy:
         verbose=True,
     )
 
+@functools.lru_cache(maxsize=64)
+def get_page_run_config(session_id: Optional[str]) -> CrawlerRunConfig:
+    """Returns the plain page crawl configuration, built once per session id."""
+    return CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        session_id=session_id,
+    )
+
+@functools.lru_cache(maxsize=64)
+def get_llm_run_config(session_id: Optional[str], llm_strategy: LLMExtractionStrategy) -> CrawlerRunConfig:
+    """Returns the LLM extraction crawl configuration, built once per session id and strategy."""
+    return CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        extraction_strategy=llm_strategy,
+        session_id=session_id,
+    )
+
 def extract_emails_from_text(text: str) -> List[str]:
     """Extract email addresses from text using regex."""
-    if not text:
+    # Every match needs an '@', so pages without one skip the regex scan entirely
+    if not text or '@' not in text:
         return []
     
-    # Find all email-like patterns
-    potential_emails = re.findall(EMAIL_REGEX, text)
+    # Jump between '@' signs with str.find and only run the regex where an address can start.
+    # This returns the same matches as EMAIL_RE.findall without testing every position of the page.
+    potential_emails = []
+    scan_from = 0
+    at = text.find('@')
+    while at != -1:
+        # Walk back to the start of the local part, staying after the previous match like findall
+        start = at
+        while start > scan_from and text[start - 1] in EMAIL_LOCAL_CHARS:
+            start -= 1
+        
+        match = EMAIL_RE.match(text, start) if start < at else None
+        if match:
+            potential_emails.append(match.group())
+            scan_from = match.end()
+            at = text.find('@', scan_from)
+        else:
+            at = text.find('@', at + 1)
+    
+    # Filter out filenames like "logo@2x.png" with a single tuple endswith per match
+    return [email for email in potential_emails if not email.lower().endswith(EXCLUDED_EXTENSIONS)]
+
+def is_congestion_status(status_code: Optional[int]) -> bool:
+    """Whether an HTTP status means the server is rate limiting or overloaded (429 or 5xx)."""
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+def might_contain_email(html: str) -> bool:
+    """Cheap check for an "@" or a common obfuscation like "[at]" before paying for LLM extraction."""
+    if '@' in html or '&#64;' in html:
+        return True
+    lowered = html.lower()
+    return any(hint in lowered for hint in OBFUSCATED_AT_HINTS)
+
+# Underscore runs become spaces and URL-encoded characters are dropped, in one pass over the name
+NAME_CLEANUP_RE = re.compile(r'_+|%[0-9A-Fa-f]{2}')
+
+# Characters that cannot appear in a guessed domain or an output filename
+NON_WORD_RE = re.compile(r'[^\w]')
+
+# Legal-form suffixes stripped from LinkedIn company slugs before guessing a domain
+LINKEDIN_COMPANY_SUFFIXES = ('-inc', '-gmbh', '-llc', '-ltd', '-ab', '-co', '-group')
+
+# Section labels read from a SeedTable company page
+SEEDTABLE_SECTION_LABELS = ('Websites:', 'Social accounts:')
+
+def clean_name_match(match: re.Match) -> str:
+    """Replacement for NAME_CLEANUP_RE: a space for underscores, nothing for URL encodings."""
+    return ' ' if match.group().startswith('_') else ''
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL for visited-page checks.
+    
+    Scheme and host are lowercased, a leading 'www.' and trailing slashes are dropped and
+    the fragment is removed, so 'https://www.X.com/contact/#team' and 'https://x.com/contact'
+    count as the same page.
     
-    # Filter out non-valid emails (filenames, etc.)
-    return [email for email in potential_emails if is_valid_email(email)]
+    Args:
+        url: The URL to normalize
+        
+    Returns:
+        The canonical form of the URL
+    """
+    parts = urllib.parse.urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    canonical = f"{parts.scheme.lower()}://{host}{parts.path.rstrip('/')}"
+    return f"{canonical}?{parts.query}" if parts.query else canonical
+
+# Timeout for each HEAD probe used to verify a guessed website
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=3)
+
+async def probe_website(session: aiohttp.ClientSession, url: str) -> bool:
+    """Check whether a guessed website answers a HEAD request without an error status."""
+    reachable = cache_get(probe_cache, url)
+    if reachable is not None:
+        return reachable
+    
+    task = probes_in_flight.get(url)
+    if task is None:
+        task = asyncio.create_task(send_probe(session, url))
+        probes_in_flight[url] = task
+        task.add_done_callback(lambda done: forget_probe(url, done))
+    
+    probe_waiters[url] = probe_waiters.get(url, 0) + 1
+    try:
+        # Shielded so one caller cancelling its probes does not cancel them for other waiters
+        return await asyncio.shield(task)
+    finally:
+        probe_waiters[url] -= 1
+        if not probe_waiters[url]:
+            del probe_waiters[url]
+            # Nobody wants the answer any more (e.g. another guess already won), so stop the request
+            if not task.done():
+                forget_probe(url, task)
+                task.cancel()
 
-def get_company_info_from_seedtable(company_id: str) -> Dict[str, Any]:
+def forget_probe(url: str, task: "asyncio.Task[bool]") -> None:
+    """Drop a probe from probes_in_flight, unless a newer probe for the URL replaced it."""
+    if probes_in_flight.get(url) is task:
+        del probes_in_flight[url]
+
+async def send_probe(session: aiohttp.ClientSession, url: str) -> bool:
+    """Send the HEAD request behind probe_website and cache its outcome."""
+    try:
+        async with session.head(url, timeout=PROBE_TIMEOUT) as response:
+            reachable = response.status < 400
+    except Exception as e:
+        print(f"Error checking {url}: {e}")
+        reachable = False
+    
+    cache_put(probe_cache, url, reachable)
+    return reachable
+
+async def find_reachable_website(session: aiohttp.ClientSession, website_guesses: List[str]) -> Optional[str]:
+    """
+    Probe all website guesses concurrently.
+    
+    Args:
+        session: The aiohttp session used for the probes
+        website_guesses: Candidate URLs, most likely first
+        
+    Returns:
+        The first reachable guess in list order, or None if none responded
+    """
+    tasks = [asyncio.create_task(probe_website(session, guess)) for guess in website_guesses]
+    try:
+        # Await in list order so the first valid guess returns without waiting on less likely ones
+        for guess, task in zip(website_guesses, tasks):
+            if await task:
+                return guess
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+def parse_seedtable_page(content: bytes) -> Tuple[List[str], Optional[str]]:
+    """
+    Parse the website and LinkedIn links out of a SeedTable company page.
+    
+    Args:
+        content: The raw HTML of the page
+        
+    Returns:
+        Tuple of (website URLs, LinkedIn URL or None)
+    """
+    websites = []
+    linkedin = None
+    soup = BeautifulSoup(content, 'lxml')
+    
+    # Find the "Websites:" and "Social accounts:" labels in a single pass over the page
+    websites_section = None
+    social_links_section = None
+    for label in soup.find_all('span', string=SEEDTABLE_SECTION_LABELS):
+        if label.string == 'Websites:':
+            websites_section = websites_section or label
+        else:
+            social_links_section = social_links_section or label
+    
+    # Look for website links under the "Websites:" label
+    if websites_section:
+        # Find the parent li element that contains the websites list
+        parent_li = websites_section.find_parent('li')
+        if parent_li:
+            # Find the ul element inside that contains the website links
+            websites_ul = parent_li.find('ul', class_='flex-1')
+            if websites_ul:
+                for link in websites_ul.find_all('a'):
+                    if 'href' in link.attrs:
+                        websites.append(link['href'])
+    
+    # Look for social links to find LinkedIn
+    if social_links_section:
+        parent_li = social_links_section.find_parent('li')
+        if parent_li:
+            linkedin_link = parent_li.find('a', href=lambda href: href and 'linkedin.com' in href)
+            if linkedin_link:
+                linkedin = linkedin_link['href']
+    
+    return websites, linkedin
+
+async def get_company_info_from_seedtable(company_id: str) -> Dict[str, Any]:
     """
     Extract company information from a SeedTable page using BeautifulSoup.
     
@@ -104,50 +399,33 @@ def get_company_info_from_seedtable(company_id: str) -> Dict[str, Any]:
     }
     
     # Clean up company name by removing special characters and URL encodings
-    company_info["name"] = re.sub(r'_+', ' ', company_info["name"])
-    company_info["name"] = re.sub(r'%[0-9A-Fa-f]{2}', '', company_info["name"])
-    company_info["name"] = company_info["name"].strip()
+    company_info["name"] = NAME_CLEANUP_RE.sub(clean_name_match, company_info["name"]).strip()
+    
+    cached_info = cache_get(seedtable_cache, company_id)
+    if cached_info is not None:
+        print(f"Using cached SeedTable info for: {company_id}")
+        # Callers extend the lists, so hand out a copy
+        return copy.deepcopy(cached_info)
     
     seedtable_url = f"{SEEDTABLE_BASE_URL}{company_id}"
     print(f"Fetching company info from: {seedtable_url}")
     
+    session = await get_session()
     try:
-        response = requests.get(seedtable_url)
-        if response.status_code != 200:
-            print(f"Failed to access SeedTable page: {seedtable_url}")
-            return company_info
-        
-        # Parse the HTML with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for website links - first find the "Websites:" label then get the links
-        websites_section = soup.find('span', string='Websites:')
-        if websites_section:
-            # Find the parent li element that contains the websites list
-            parent_li = websites_section.find_parent('li')
-            if parent_li:
-                # Find the ul element inside that contains the website links
-                websites_ul = parent_li.find('ul', class_='flex-1')
-                if websites_ul:
-                    # Get all website links
-                    website_links = websites_ul.find_all('a')
-                    for link in website_links:
-                        if 'href' in link.attrs:
-                            website_url = link['href']
-                            company_info["websites"].append(website_url)
-                    
-                    if company_info["websites"]:
-                        print(f"Found company websites: {company_info['websites']}")
-        
-        # Look for social links to find LinkedIn
-        social_links_section = soup.find('span', string='Social accounts:')
-        if social_links_section:
-            parent_li = social_links_section.find_parent('li')
-            if parent_li:
-                linkedin_link = parent_li.find('a', href=lambda href: href and 'linkedin.com' in href)
-                if linkedin_link:
-                    company_info["linkedin"] = linkedin_link['href']
-                    print(f"Found LinkedIn URL: {company_info['linkedin']}")
+        async with session.get(seedtable_url) as response:
+            if response.status != 200:
+                print(f"Failed to access SeedTable page: {seedtable_url}")
+                return company_info
+            content = await response.read()
+        
+        # Parse off the event loop so other companies keep crawling meanwhile
+        websites, linkedin = await asyncio.to_thread(parse_seedtable_page, content)
+        company_info["websites"].extend(websites)
+        if websites:
+            print(f"Found company websites: {company_info['websites']}")
+        if linkedin:
+            company_info["linkedin"] = linkedin
+            print(f"Found LinkedIn URL: {company_info['linkedin']}")
         
         # If no websites found, try to guess from LinkedIn or company name
         if not company_info["websites"] and company_info["linkedin"]:
@@ -155,7 +433,11 @@ def get_company_info_from_seedtable(company_id: str) -> Dict[str, Any]:
             company_path = company_info["linkedin"].split('linkedin.com/company/')[-1].split('/')[0].strip()
             if company_path:
                 # Remove common suffixes like -inc, -gmbh, etc.
-                clean_name = re.sub(r'-(inc|gmbh|llc|ltd|ab|co|group)$', '', company_path)
+                clean_name = company_path
+                for suffix in LINKEDIN_COMPANY_SUFFIXES:
+                    if clean_name.endswith(suffix):
+                        clean_name = clean_name[:-len(suffix)]
+                        break
                 
                 # Try common domain formats
                 website_guesses = [
@@ -163,21 +445,16 @@ def get_company_info_from_seedtable(company_id: str) -> Dict[str, Any]:
                     f"https://www.{clean_name}.com"
                 ]
                 
-                # Try each guess and see if it's valid
-                for guess in website_guesses:
-                    try:
-                        verify_resp = requests.head(guess, timeout=3)
-                        if verify_resp.status_code < 400:  # Valid website
-                            company_info["websites"].append(guess)
-                            print(f"Found company website (guessed from LinkedIn): {guess}")
-                            break
-                    except:
-                        continue
+                # Probe the guesses concurrently and keep the first valid one
+                guess = await find_reachable_website(session, website_guesses)
+                if guess:
+                    company_info["websites"].append(guess)
+                    print(f"Found company website (guessed from LinkedIn): {guess}")
         
         # If still no websites found, try to guess from company name
         if not company_info["websites"]:
             # Clean up the company name for URL guessing
-            clean_name = re.sub(r'[^\w]', '', company_info["name"].lower())
+            clean_name = NON_WORD_RE.sub('', company_info["name"].lower())
             
             # Try common domain formats
             website_guesses = [
@@ -189,104 +466,172 @@ def get_company_info_from_seedtable(company_id: str) -> Dict[str, Any]:
                 f"https://www.{clean_name}.co"
             ]
             
-            # Try each guess and see if it's valid
-            for guess in website_guesses:
-                try:
-                    print(f"Trying URL guess: {guess}")
-                    verify_resp = requests.head(guess, timeout=3)
-                    if verify_resp.status_code < 400:  # Valid website
-                        company_info["websites"].append(guess)
-                        print(f"Found company website (guessed from company name): {guess}")
-                        break
-                except Exception as e:
-                    print(f"Error checking {guess}: {e}")
-                    continue
+            # Probe the guesses concurrently and keep the first valid one
+            print(f"Trying URL guesses: {website_guesses}")
+            guess = await find_reachable_website(session, website_guesses)
+            if guess:
+                company_info["websites"].append(guess)
+                print(f"Found company website (guessed from company name): {guess}")
         
         if not company_info["websites"]:
             print("No company website found on SeedTable page.")
         
+        cache_put(seedtable_cache, company_id, copy.deepcopy(company_info))
         return company_info
         
     except Exception as e:
         print(f"Error fetching company info: {e}")
         return company_info
 
-async def extract_links_from_page(crawler: AsyncWebCrawler, url: str, session_id: str) -> List[Dict[str, str]]:
+def find_contact_links(cleaned_html: str, url: str) -> Tuple[List[Dict[str, str]], List[str]]:
+    """
+    Find the links of a crawled page that might lead to contact information.
+    
+    Args:
+        cleaned_html: The cleaned HTML of the page
+        url: The page URL, used to resolve relative links
+        
+    Returns:
+        Tuple of (contact links as dicts with 'text' and 'url', emails from mailto links)
+    """
+    links = []
+    
+    # Extract emails from all mailto links with one scan of the HTML. The scan also sees
+    # stray "mailto:" text and placeholders, so keep only addresses that look valid
+    emails_from_mailto = [email for email in MAILTO_HTML_RE.findall(cleaned_html) if is_valid_email(email)]
+    for email in emails_from_mailto:
+        print(f"Found email in mailto link: {email}")
+    
+    # Parse the anchors out of the HTML (handles quoting styles and nested tags)
+    soup = BeautifulSoup(cleaned_html, 'lxml', parse_only=LINK_STRAINER)
+    
+    # Filter for contact-related links
+    for anchor in soup.find_all('a', href=True):
+        href = anchor['href']
+        text = anchor.get_text(' ', strip=True)
+        # Mailto links were already collected above
+        if href.startswith('mailto:'):
+            continue
+            
+        # Lowercase text and href once per link; the separator keeps matches from spanning both
+        haystack = f"{text}\x00{href}".lower()
+        if CONTACT_KEYWORDS_RE.search(haystack):
+            # Convert relative URLs to absolute
+            if href.startswith('/'):
+                base_url = urllib.parse.urlparse(url)
+                href = f"{base_url.scheme}://{base_url.netloc}{href}"
+            
+            links.append({"text": text, "url": href})
+    
+    return links, emails_from_mailto
+
+def get_cached_page(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached result of a page from memory or the disk cache, or None if missing."""
+    cached_page = cache_get(page_cache, cache_key)
+    if cached_page is None and email_cache is not None:
+        cached_page = email_cache.get(cache_key)
+        if cached_page is not None:
+            cache_put(page_cache, cache_key, cached_page)
+    return cached_page
+
+async def extract_links_from_page(crawler: AsyncWebCrawler, url: str, session_id: str) -> Tuple[List[Dict[str, str]], List[str]]:
     """Extract all links from the page that might lead to contact information."""
+    # A page scanned for emails with_links already had its links extracted from the same crawl
+    cache_key = canonical_url(url)
+    cached_page = get_cached_page(cache_key)
+    if cached_page is not None and cached_page["links"] is not None:
+        return list(cached_page["links"]), list(cached_page["mailto"])
+    
     result = await crawler.arun(
         url=url,
-        config=CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,
-            session_id=session_id,
-        ),
+        config=get_page_run_config(session_id),
     )
     
-    links = []
-    emails_from_mailto = []
-    
     if result.success:
-        # Use a simple regex to extract links and their text from HTML
-        link_pattern = re.compile(r'<a\s+(?:[^>]*?\s+)?href="([^"]*)"(?:\s+[^>]*?)?>([^<]*)<\/a>', re.IGNORECASE)
-        matches = link_pattern.findall(result.cleaned_html)
-        
-        # Filter for contact-related links
-        for href, text in matches:
-            text = text.strip()
-            # Extract emails from mailto links
-            if href.startswith('mailto:'):
-                email_match = re.search(r'mailto:([^?]+)', href)
-                if email_match:
-                    email = email_match.group(1)
-                    print(f"Found email in mailto link: {email}")
-                    emails_from_mailto.append(email)
-                continue
-                
-            if any(keyword.lower() in text.lower() or keyword.lower() in href.lower() for keyword in CONTACT_KEYWORDS):
-                # Convert relative URLs to absolute
-                if href.startswith('/'):
-                    base_url = urllib.parse.urlparse(url)
-                    href = f"{base_url.scheme}://{base_url.netloc}{href}"
-                
-                links.append({"text": text, "url": href})
-    
-    return links, emails_from_mailto
+        links, mailto_emails = find_contact_links(result.cleaned_html, url)
+        if cached_page is not None:
+            # Complete the cached entry so the next lookup of this page skips the crawl too
+            page_result = {**cached_page, "links": links, "mailto": mailto_emails}
+            cache_put(page_cache, cache_key, page_result)
+            if email_cache is not None:
+                email_cache.put(cache_key, page_result)
+        return links, mailto_emails
+    return [], []
 
-async def scan_page_for_emails(crawler: AsyncWebCrawler, url: str, session_id: str, llm_strategy: Optional[LLMExtractionStrategy] = None) -> List[str]:
-    """Scan a page for email addresses using both regex and LLM extraction."""
+async def scan_page_for_emails(crawler: AsyncWebCrawler, url: str, session_id: Optional[str], llm_strategy: Optional[LLMExtractionStrategy] = None, congested_pages: Optional[Set[str]] = None, with_links: bool = False) -> List[str]:
+    """
+    Scan a page for email addresses using both regex and LLM extraction.
+    
+    Callers that call extract_links_from_page on the page next pass with_links, so its contact
+    links are taken from the same crawl; contact pages skip that extra parse.
+    
+    Pages whose crawl times out or is answered with HTTP 429/5xx are added to congested_pages
+    when given. Unreachable sites and LLM failures are not: they say nothing about load.
+    """
     print(f"Scanning page: {url}")
     
     # Check if this is a mailto link, which we can't crawl
     if url.startswith('mailto:'):
-        email_match = re.search(r'mailto:([^?]+)', url)
+        email_match = MAILTO_RE.match(url)
         if email_match:
             return [email_match.group(1)]
         return []
+    
+    # Key on the canonical URL, the same form the visited-page checks use
+    cache_key = canonical_url(url)
+    cached_page = get_cached_page(cache_key)
+    if cached_page is not None:
+        print(f"Using cached result for: {url}")
+        return list(cached_page["emails"])
         
-    emails = []
+    # A set keeps addresses repeated across the page (or by the LLM) only once
+    emails: Set[str] = set()
+    page_html = None
+    cleaned_html = None
+    page_loaded = False
+    # Set when the LLM pass runs / gets an answer; an unanswered pass leaves the result incomplete
+    llm_attempted = False
+    llm_answered = False
     
     # First approach: Direct HTML scanning with regex
     try:
         result = await asyncio.wait_for(
             crawler.arun(
                 url=url,
-                config=CrawlerRunConfig(
-                    cache_mode=CacheMode.BYPASS,
-                    session_id=session_id,
-                ),
+                config=get_page_run_config(session_id),
             ),
             timeout=30  # 30 second timeout to prevent hanging
         )
         
+        if congested_pages is not None and is_congestion_status(result.status_code):
+            congested_pages.add(url)
+        
         if result.success:
             # Extract emails from raw HTML
-            emails = extract_emails_from_text(result.cleaned_html)
+            emails.update(extract_emails_from_text(result.cleaned_html))
+            page_html = result.html
+            cleaned_html = result.cleaned_html
+            page_loaded = True
+        else:
+            print(f"Failed to load page {url}: {result.error_message}")
     except asyncio.TimeoutError:
         print(f"Timeout scanning page: {url}")
-        return emails
+        if congested_pages is not None:
+            congested_pages.add(url)
+        return sorted(emails)
     except Exception as e:
         print(f"Error scanning page {url}: {e}")
-        return emails# Second approach: Use LLM to extract emails if provided
-    if llm_strategy and not emails:
+        return sorted(emails)
+    
+    # A fetched page with no "@" and no spelled-out "at" cannot hold an email, so skip the LLM call.
+    # Check the cleaned HTML the regex scanned: raw HTML nearly always has an "@" in CSS or scripts
+    has_email_hint = cleaned_html is None or might_contain_email(cleaned_html)
+    if llm_strategy and not emails and not has_email_hint:
+        print(f"No email hints on {url}, skipping LLM extraction")
+    
+    # Second approach: Use LLM to extract emails if provided
+    if llm_strategy and not emails and has_email_hint:
+        llm_attempted = True
         try:
             # Maximum retries for LLM extraction
             max_retries = 2
@@ -297,33 +642,34 @@ async def scan_page_for_emails(crawler: AsyncWebCrawler, url: str, session_id: s
                     attempt += 1
                     
                     # Add timeout to avoid hanging requests
+                    # Reuse the page fetched above ("raw:" skips the network) and only fall back to a fresh crawl
                     llm_result = await asyncio.wait_for(
                         crawler.arun(
-                            url=url,
-                            config=CrawlerRunConfig(
-                                cache_mode=CacheMode.BYPASS,
-                                extraction_strategy=llm_strategy,
-                                session_id=session_id,
-                            ),
+                            url=f"raw:{page_html}" if page_html else url,
+                            config=get_llm_run_config(session_id, llm_strategy),
                         ), 
                         timeout=45  # 45 second timeout to give more time for LLM processing
                     )
                     
+                    if llm_result.success:
+                        llm_answered = True
+                        # Without a first crawl, the LLM crawl is the one the links come from
+                        cleaned_html = cleaned_html or llm_result.cleaned_html
+                    
                     if llm_result.success and llm_result.extracted_content:
                         try:                            # Parse LLM output as JSON
-                            import json
                             extracted_data = json.loads(llm_result.extracted_content)
                             if extracted_data and 'emails' in extracted_data:
                                 # Filter out invalid emails (filenames, etc.)
-                                valid_emails = [email for email in extracted_data['emails'] if is_valid_email(email)]
-                                emails.extend(valid_emails)
+                                valid_emails = {email for email in extracted_data['emails'] if is_valid_email(email)}
+                                emails.update(valid_emails)
                                 llm_success = True
                                 print(f"LLM extraction successful: found {len(valid_emails)} valid emails from {len(extracted_data['emails'])} candidates")
                         except json.JSONDecodeError:                            # If not valid JSON, try to extract emails using regex
                             print(f"LLM returned invalid JSON. Falling back to regex extraction.")
                             additional_emails = extract_emails_from_text(llm_result.extracted_content)
                             if additional_emails:
-                                emails.extend(additional_emails)
+                                emails.update(additional_emails)
                                 llm_success = True
                                 print(f"Extracted {len(additional_emails)} valid emails from LLM raw output using regex")
                 except asyncio.TimeoutError:
@@ -352,19 +698,92 @@ async def scan_page_for_emails(crawler: AsyncWebCrawler, url: str, session_id: s
             print(f"LLM extraction error: {e}")
             print("Falling back to regex extraction only.")
     
-    return emails
+    found_emails = sorted(emails)
+    
+    # Only remember complete results, in memory and on disk: a page that failed to load, or
+    # whose LLM pass never answered, is crawled again the next time (or next run) it is asked for
+    complete = llm_answered if llm_attempted else page_loaded
+    if complete:
+        page_result = {"emails": found_emails, "links": None, "mailto": None}
+        if with_links:
+            # Keep the contact links of the same crawl so extract_links_from_page does not load the page again
+            page_result["links"], page_result["mailto"] = find_contact_links(cleaned_html or '', url)
+        cache_put(page_cache, cache_key, page_result)
+        if email_cache is not None:
+            email_cache.put(cache_key, page_result)
+    return found_emails
+
+async def scan_contact_links(crawler: AsyncWebCrawler, links: List[Dict[str, str]], visited_urls: Set[str], llm_strategy: Optional[LLMExtractionStrategy], stop_on_first: bool = False) -> Set[str]:
+    """
+    Scan the contact links of a website for emails, skipping pages that were already visited.
+    
+    Args:
+        crawler: The running crawler
+        links: Contact links as returned by extract_links_from_page
+        visited_urls: Canonical URLs already scanned; the links scanned here are added to it
+        llm_strategy: The LLM extraction strategy
+        stop_on_first: Stop as soon as one page yields emails and cancel the crawls still in flight
+        
+    Returns:
+        The emails found on the scanned pages
+    """
+    links_to_scan = []
+    for link_data in links:
+        link_url = link_data["url"]
+        
+        # Skip invalid URLs or already visited URLs
+        if link_url.startswith('mailto:'):
+            continue
+        canonical_link = canonical_url(link_url)
+        if canonical_link in visited_urls:
+            continue
+        
+        visited_urls.add(canonical_link)
+        links_to_scan.append(link_data)
+    
+    # Contact pages are independent, so check them concurrently (bounded for politeness)
+    link_semaphore = asyncio.Semaphore(LINK_CONCURRENCY)
+    
+    async def check_link(link_data):
+        async with link_semaphore:
+            print(f"Checking link: '{link_data['text']}' at {link_data['url']}")
+            try:
+                # No session id: concurrent crawls must not share one browser page
+                link_emails = await scan_page_for_emails(crawler, link_data["url"], None, llm_strategy)
+            except Exception as e:
+                print(f"Error checking link {link_data['url']}: {e}")
+                return []
+        
+        if link_emails:
+            print(f"Found emails on page '{link_data['text']}': {link_emails}")
+        return link_emails
+    
+    found_emails: Set[str] = set()
+    tasks = [asyncio.create_task(check_link(link_data)) for link_data in links_to_scan]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            link_emails = await next_done
+            found_emails.update(link_emails)
+            if link_emails and stop_on_first:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return found_emails
 
-async def crawl_for_contact_email(seedtable_company_id: Optional[str] = None, website_url: Optional[str] = None):
+async def crawl_for_contact_email(seedtable_company_id: Optional[str] = None, website_url: Optional[str] = None, crawler: Optional[AsyncWebCrawler] = None, session_id: str = "email_finder_session"):
     """
     Main function to crawl the website for contact email.
     
     Args:
         seedtable_company_id: The ID/slug of the company on SeedTable
         website_url: Optional direct website URL (bypassing SeedTable)
+        crawler: Running crawler shared by the caller (a new browser is started if not provided)
+        session_id: Crawler session to use; concurrent calls on a shared crawler need distinct ids
     """
     browser_config = get_browser_config()
     llm_strategy = get_llm_strategy()
-    session_id = "email_finder_session"
     
     visited_urls = set()
     
@@ -373,7 +792,7 @@ async def crawl_for_contact_email(seedtable_company_id: Optional[str] = None, we
     
     if seedtable_company_id:
         # Extract company info from SeedTable using BeautifulSoup
-        company_info = get_company_info_from_seedtable(seedtable_company_id)
+        company_info = await get_company_info_from_seedtable(seedtable_company_id)
     elif website_url:
         # Use provided website URL directly
         company_info = {
@@ -383,11 +802,12 @@ async def crawl_for_contact_email(seedtable_company_id: Optional[str] = None, we
             "emails": []
         }
         # Extract domain for company name
-        domain = re.search(r'https?://(?:www\.)?([^/]+)', website_url)
-        if domain:
-            domain_parts = domain.group(1).split('.')
-            if len(domain_parts) > 1:
-                company_info["name"] = domain_parts[0]
+        host = urllib.parse.urlparse(website_url).netloc
+        if host.startswith('www.'):
+            host = host[4:]
+        domain_parts = host.split('.', 1)
+        if len(domain_parts) > 1:
+            company_info["name"] = domain_parts[0]
     else:
         print("Error: Either seedtable_company_id or website_url must be provided.")
         return
@@ -397,17 +817,22 @@ async def crawl_for_contact_email(seedtable_company_id: Optional[str] = None, we
         return
     
     # Format output filename
-    domain_name = re.sub(r'[^\w]', '_', company_info["name"].lower())
+    domain_name = NON_WORD_RE.sub('_', company_info["name"].lower())
     output_file = f"{domain_name}_contact_info.csv"
     
-    # Begin crawling with crawl4ai
-    async with AsyncWebCrawler(config=browser_config) as crawler:
+    # Collect into a set so repeated addresses across pages are deduplicated as they arrive
+    found_emails: Set[str] = set(company_info["emails"])
+    
+    # Begin crawling with crawl4ai, reusing the caller's browser when one is passed in
+    async with contextlib.AsyncExitStack() as stack:
+        if crawler is None:
+            crawler = await stack.enter_async_context(AsyncWebCrawler(config=browser_config))
         # Check each website in the list if multiple are available
         for website in company_info["websites"]:
             print(f"\nChecking company website: {website}")
-            main_page_emails = await scan_page_for_emails(crawler, website, session_id, llm_strategy)
-            company_info["emails"].extend(main_page_emails)
-            visited_urls.add(website)
+            main_page_emails = await scan_page_for_emails(crawler, website, session_id, llm_strategy, with_links=True)
+            found_emails.update(main_page_emails)
+            visited_urls.add(canonical_url(website))
             
             if main_page_emails:
                 print(f"Found emails on main page: {main_page_emails}")
@@ -416,32 +841,14 @@ async def crawl_for_contact_email(seedtable_company_id: Optional[str] = None, we
             
             # Extract and follow potentially useful links
             links_to_check, mailto_emails = await extract_links_from_page(crawler, website, session_id)
-            company_info["emails"].extend(mailto_emails)  # Add emails from mailto links
+            found_emails.update(mailto_emails)  # Add emails from mailto links
             print(f"Found {len(links_to_check)} potential contact links to check")
             
-            for link_data in links_to_check:
-                link_url = link_data["url"]
-                link_text = link_data["text"]
-                
-                # Skip invalid URLs or already visited URLs
-                if link_url in visited_urls or link_url.startswith('mailto:'):
-                    continue
-                    
-                print(f"Checking link: '{link_text}' at {link_url}")
-                visited_urls.add(link_url)
-                
-                # Pause between requests
-                await asyncio.sleep(1)
-                
-                # Check the linked page for emails
-                link_emails = await scan_page_for_emails(crawler, link_url, session_id, llm_strategy)
-                
-                if link_emails:
-                    print(f"Found emails on page '{link_text}': {link_emails}")
-                    company_info["emails"].extend(link_emails)
+            # Stop as soon as one contact page yields emails
+            found_emails.update(await scan_contact_links(crawler, links_to_check, visited_urls, llm_strategy, stop_on_first=True))
         
-        # Remove duplicate emails
-        company_info["emails"] = list(set(company_info["emails"]))
+        # Sort once so the output is stable between runs
+        company_info["emails"] = sorted(found_emails)
     
     # Display results
     if company_info["emails"]:
@@ -494,12 +901,17 @@ def process_all_country_csvs():
     
     print("Consolidated contact information saved to 'consolidated_contact_info.csv'")
 
-async def find_emails_for_company(website_url: str) -> List[str]:
+async def find_emails_for_company(website_url: str, browser_config: Optional[BrowserConfig] = None, llm_strategy: Optional[LLMExtractionStrategy] = None, crawler: Optional[AsyncWebCrawler] = None, session_id: str = "email_finder_session", congested_pages: Optional[Set[str]] = None) -> List[str]:
     """
     Find email addresses for a company using the website URL.
     
     Args:
         website_url: The website URL to check for emails
+        browser_config: Browser configuration shared by the caller (built if not provided)
+        llm_strategy: LLM extraction strategy shared by the caller (built if not provided)
+        crawler: Running crawler shared by the caller (a new browser is started if not provided)
+        session_id: Crawler session to use; concurrent calls on a shared crawler need distinct ids
+        congested_pages: Collects the pages that timed out or were answered with HTTP 429/5xx, if given
         
     Returns:
         List of email addresses found
@@ -509,34 +921,38 @@ async def find_emails_for_company(website_url: str) -> List[str]:
     old_recursion_limit = sys.getrecursionlimit()
     sys.setrecursionlimit(3000)  # Increase from default 1000 to 3000
     
-    browser_config = get_browser_config()
-    llm_strategy = get_llm_strategy()
-    session_id = "email_finder_session"
-    emails = []
+    browser_config = browser_config or get_browser_config()
+    llm_strategy = llm_strategy or get_llm_strategy()
+    # Deduplicate as pages are scanned instead of once at the end
+    emails: Set[str] = set()
     
     # Skip if no website URL
     if not website_url:
-        return emails
+        return []
     
     # Skip if URL is invalid
     if not website_url.startswith(('http://', 'https://')):
-        return emails
+        return []
         
     try:
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        async with contextlib.AsyncExitStack() as stack:
+            if crawler is None:
+                crawler = await stack.enter_async_context(AsyncWebCrawler(config=browser_config))
+            
             # Step 1: Check main page
             try:
-                main_emails = await scan_page_for_emails(crawler, website_url, session_id, llm_strategy)
-                emails.extend(main_emails)
+                main_emails = await scan_page_for_emails(crawler, website_url, session_id, llm_strategy, congested_pages, with_links=True)
+                emails.update(main_emails)
                 
                 # Step 2: Check for contact links
                 links_to_check, mailto_emails = await extract_links_from_page(crawler, website_url, session_id)
-                emails.extend(mailto_emails)
+                emails.update(mailto_emails)
                 
                 # Step 3: Check contact pages (up to 3)
-                checked_count = 0
+                contact_urls = []
+                seen_urls = {canonical_url(website_url)}
                 for link_data in links_to_check:
-                    if checked_count >= 3:  # Limit to 3 contact pages to avoid excessive crawling
+                    if len(contact_urls) >= MAX_CONTACT_PAGES:  # Limit contact pages to avoid excessive crawling
                         break
                         
                     link_url = link_data["url"]
@@ -545,27 +961,32 @@ async def find_emails_for_company(website_url: str) -> List[str]:
                     if not link_url.startswith(('http://', 'https://')) or link_url.startswith('mailto:'):
                         continue
                     
-                    # Skip if URL is the same as the main website to avoid recursion
-                    if link_url.rstrip('/') == website_url.rstrip('/'):
+                    # Skip the main website (to avoid recursion) and links already queued
+                    canonical_link = canonical_url(link_url)
+                    if canonical_link in seen_urls:
                         continue
-                        
+                    seen_urls.add(canonical_link)
+                    contact_urls.append(link_url)
+                
+                async def check_contact_page(link_url):
                     try:
-                        # Check for emails on contact page with a timeout
-                        link_emails = await asyncio.wait_for(
-                            scan_page_for_emails(crawler, link_url, session_id, llm_strategy),
+                        # Check for emails on contact page with a timeout.
+                        # No session id: concurrent crawls must not share one browser page
+                        return await asyncio.wait_for(
+                            scan_page_for_emails(crawler, link_url, None, llm_strategy, congested_pages),
                             timeout=30  # 30 second timeout to avoid hanging
                         )
-                        emails.extend(link_emails)
-                        checked_count += 1
-                        
-                        # Pause between requests
-                        await asyncio.sleep(0.5)
                     except asyncio.TimeoutError:
                         print(f"Timeout checking link {link_url}")
-                        continue
+                        if congested_pages is not None:
+                            congested_pages.add(link_url)
                     except Exception as e:
                         print(f"Error checking link {link_url}: {e}")
-                        continue
+                    return []
+                
+                # The contact pages are independent, so crawl them concurrently (at most MAX_CONTACT_PAGES at once)
+                for link_emails in await asyncio.gather(*(check_contact_page(link_url) for link_url in contact_urls)):
+                    emails.update(link_emails)
             except Exception as e:
                 print(f"Error processing website {website_url}: {e}")
     except Exception as e:
@@ -574,8 +995,8 @@ async def find_emails_for_company(website_url: str) -> List[str]:
         # Restore original recursion limit
         sys.setrecursionlimit(old_recursion_limit)
         
-    # Remove duplicates and return
-    return list(set(emails))
+    # Sorted so the CSV output is stable between runs
+    return sorted(emails)
 
 async def process_country_csv_files(output_csv: str = 'all_european_startups_emails.csv') -> None:
     """
@@ -605,12 +1026,11 @@ async def process_country_csv_files(output_csv: str = 'all_european_startups_ema
         try:
             with open(csv_file, 'r', encoding='utf-8') as file:
                 reader = csv.DictReader(file)
-                country_companies = list(reader)
-                
-                print(f"Found {len(country_companies)} companies in {country_name}")
+                country_count = 0
                 
-                # Process each company in the CSV
-                for company in country_companies:
+                # Process each company in the CSV as it is read
+                for company in reader:
+                    country_count += 1
                     website_url = company.get('website_url', '')
                     
                     # Skip if no website URL
@@ -630,6 +1050,8 @@ async def process_country_csv_files(output_csv: str = 'all_european_startups_ema
                         'website_url': website_url,
                         'emails': []  # Will be filled later
                     }
+                
+                print(f"Found {country_count} companies in {country_name}")
         except Exception as e:
             print(f"Error processing CSV file {csv_file}: {e}")
     
@@ -639,51 +1061,91 @@ async def process_country_csv_files(output_csv: str = 'all_european_startups_ema
     companies_list = list(unique_companies.values())
     total_companies = len(companies_list)
     
-    # Create the output CSV file and write header
-    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['name', 'country', 'eu_startups_url', 'website_url', 'emails']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        # Process each company to find emails
-        for i, company in enumerate(companies_list):
-            website_url = company['website_url']
-            
-            # Calculate progress
-            progress = (i + 1) / total_companies * 100
-            
-            # Print progress
-            print(f"\r[{i+1}/{total_companies}] ({progress:.1f}%) - Processing: {company['name']} ({website_url})", end='')
-            
+    # Build the crawler configuration once for the whole run
+    browser_config = get_browser_config()
+    llm_strategy = get_llm_strategy()
+    
+    # Each concurrent company takes its own crawler session; the pool size caps how many run at once
+    session_ids = make_session_pool(COMPANY_CONCURRENCY)
+    
+    # Start one browser for the whole run instead of one per company
+    async with AsyncWebCrawler(config=browser_config) as crawler:
+        async def find_company_emails(company):
+            session_id = await session_ids.get()
             try:
-                # Extract emails
-                emails = await find_emails_for_company(website_url)
+                print(f"Processing: {company['name']} ({company['website_url']})")
+                emails = await find_emails_for_company(company['website_url'], browser_config, llm_strategy, crawler, session_id)
                 company['emails'] = ','.join(emails) if emails else ''
                 
                 if emails:
                     print(f"\nFound {len(emails)} emails for {company['name']}: {', '.join(emails[:3])}{'...' if len(emails) > 3 else ''}")
-                
-                # Write to CSV immediately to preserve progress
-                writer.writerow(company)
-                
-                # Small delay to avoid overloading
-                await asyncio.sleep(0.5)
             except Exception as e:
-                print(f"\nError finding emails for {website_url}: {e}")
+                print(f"\nError finding emails for {company['website_url']}: {e}")
                 company['emails'] = f"ERROR: {str(e)}"
+            finally:
+                session_ids.put_nowait(session_id)
+            return company
+        
+        # Create the output CSV file and write header; rows are buffered and flushed in batches
+        with open(output_csv, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as csvfile:
+            fieldnames = ['name', 'country', 'eu_startups_url', 'website_url', 'emails']
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            
+            # Write each company as soon as it finishes to preserve progress
+            for i, next_done in enumerate(asyncio.as_completed([find_company_emails(company) for company in companies_list])):
+                company = await next_done
                 writer.writerow(company)
+                if (i + 1) % CSV_FLUSH_EVERY == 0:
+                    csvfile.flush()
+                
+                # Print progress
+                progress = (i + 1) / total_companies * 100
+                print(f"\r[{i+1}/{total_companies}] ({progress:.1f}%) - Finished: {company['name']} ({company['website_url']})", end='')
     
     print(f"\n\nAll processing complete! Results saved to {output_csv}")
     print(f"Processed {total_companies} unique companies from {len(csv_files)} countries")
 
-async def process_company(company, writer, stats):
+async def write_rows(write_queue: asyncio.Queue, writer: csv.DictWriter, csvfile) -> None:
+    """
+    Write finished rows from the queue in batches until a None sentinel arrives.
+    
+    Args:
+        write_queue: Queue of company rows put by the workers
+        writer: CSV writer for the output file
+        csvfile: The open output file, flushed after every batch
+    """
+    while True:
+        # Wait for one row, then take whatever else is already waiting
+        batch = [await write_queue.get()]
+        while len(batch) < CSV_WRITE_BATCH and not write_queue.empty():
+            batch.append(write_queue.get_nowait())
+        
+        rows = [row for row in batch if row is not None]
+        writer.writerows(rows)
+        # Flush every batch so an interrupted run can resume from the rows on disk
+        csvfile.flush()
+        for _ in batch:
+            write_queue.task_done()
+        
+        if len(rows) < len(batch):
+            return
+
+async def process_company(company, write_queue: asyncio.Queue, stats, crawler: AsyncWebCrawler, session_id: str, llm_strategy: LLMExtractionStrategy):
     """
     Process a single company to extract emails.
     
     Args:
         company: Dictionary with company information
-        writer: CSV writer to write results
+        write_queue: Queue the finished row is handed to for writing
         stats: Dictionary to track statistics
+        crawler: Crawler shared by all workers
+        session_id: Crawler session owned by the calling worker
+        llm_strategy: LLM extraction strategy shared by all workers
+        
+    Returns:
+        False if any of the company's pages timed out or was answered with HTTP 429/5xx,
+        True otherwise
     """
     website_url = company.get('website_url', '')
     
@@ -691,35 +1153,47 @@ async def process_company(company, writer, stats):
     if not website_url:
         print(f"No website URL for {company.get('name', 'Unknown')}")
         company['emails'] = ''
-        # Thread-safe write to CSV
-        async with stats['csv_lock']:
-            writer.writerow(company)
+        await write_queue.put(company)
         stats['skip_count'] += 1
-        return
+        return True
     
     try:
-        # Extract emails
-        emails = await find_emails_for_company(website_url)
+        # Extract emails, noting pages that showed congestion so the limiter can back off
+        congested_pages: Set[str] = set()
+        emails = await find_emails_for_company(website_url, llm_strategy=llm_strategy, crawler=crawler, session_id=session_id, congested_pages=congested_pages)
         company['emails'] = ','.join(emails) if emails else ''
         
         if emails:
             stats['success_count'] += 1
             print(f"\nFound {len(emails)} emails for {company.get('name', '')}: {', '.join(emails[:3])}{'...' if len(emails) > 3 else ''}")
         
-        # Thread-safe write to CSV
-        async with stats['csv_lock']:
-            writer.writerow(company)
+        await write_queue.put(company)
+        if congested_pages:
+            print(f"\n{len(congested_pages)} page(s) timed out or were rate limited for {website_url}")
+        return not congested_pages
         
     except Exception as e:
         stats['error_count'] += 1
         print(f"\nError finding emails for {website_url}: {e}")
         company['emails'] = f"ERROR: {str(e)}"
-        async with stats['csv_lock']:
-            writer.writerow(company)
+        await write_queue.put(company)
+        # An error in our own processing is not a sign of load on the sites
+        return True
+
+# Progress bar segments, sliced on each update instead of being rebuilt
+PROGRESS_BAR_LENGTH = 30
+PROGRESS_BAR_FULL = '█' * PROGRESS_BAR_LENGTH
+PROGRESS_BAR_EMPTY = '░' * PROGRESS_BAR_LENGTH
 
-async def update_progress(stats, total_companies, start_time):
-    """Update progress bar periodically."""
-    while stats['processed_count'] < total_companies:
+async def update_progress(stats, total_companies, start_time, done_event: asyncio.Event):
+    """Update progress bar periodically until done_event is set."""
+    # Redraw the bar in place on a terminal; when output is redirected, log a plain
+    # line only when the whole-number percentage moves
+    interactive = sys.stdout.isatty()
+    last_line = None
+    last_percent = -1
+    
+    while not done_event.is_set():
         processed = stats['processed_count']
         progress = processed / total_companies * 100
         elapsed = time.time() - start_time
@@ -735,15 +1209,44 @@ async def update_progress(stats, total_companies, start_time):
             eta_str = "calculating..."
             rate = 0
         
-        # Create progress bar
-        bar_length = 30
-        filled_length = int(bar_length * processed / total_companies)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        if interactive:
+            # Create progress bar
+            filled_length = int(PROGRESS_BAR_LENGTH * processed / total_companies)
+            bar = PROGRESS_BAR_FULL[:filled_length] + PROGRESS_BAR_EMPTY[filled_length:]
+            line = f"\r[{bar}] {processed}/{total_companies} ({progress:.1f}%) ETA: {eta_str} Rate: {rate:.1f}/min - Active workers: {stats['active_workers']}"
+            
+            # Skip the write when nothing visible changed since the last tick
+            if line != last_line:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+                last_line = line
+        elif int(progress) != last_percent:
+            last_percent = int(progress)
+            sys.stdout.write(f"Progress: {processed}/{total_companies} ({progress:.1f}%) ETA: {eta_str}\n")
+            sys.stdout.flush()
         
-        # Print progress
-        print(f"\r[{bar}] {processed}/{total_companies} ({progress:.1f}%) ETA: {eta_str} Rate: {rate:.1f}/min - Active workers: {stats['active_workers']}", end='')
+        # Update every second, or stop right away once processing is done
+        try:
+            await asyncio.wait_for(done_event.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            pass
+
+def count_input_companies(input_csv: str, skip_websites: Optional[Set[str]] = None) -> int:
+    """
+    Count the companies in an input CSV without keeping the rows in memory.
+    
+    Args:
+        input_csv: The input CSV file with company data
+        skip_websites: Website URLs that should not be counted
         
-        await asyncio.sleep(1)  # Update every second
+    Returns:
+        The number of companies left to process
+    """
+    with open(input_csv, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        if not skip_websites:
+            return sum(1 for _ in reader)
+        return sum(1 for row in reader if row.get('website_url') not in skip_websites)
 
 async def process_consolidated_csv(input_csv: str, output_csv: str = 'european_startups_with_emails.csv', workers: int = 1) -> None:
     """
@@ -754,14 +1257,10 @@ async def process_consolidated_csv(input_csv: str, output_csv: str = 'european_s
         output_csv: The output CSV file with added emails
         workers: Number of concurrent workers
     """
-    companies = []
-    
-    # Read the input CSV
+    # Count the input rows; the companies themselves are streamed to the workers later
     try:
-        with open(input_csv, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            companies = list(reader)
-            print(f"Found {len(companies)} companies in {input_csv}")
+        total_companies = count_input_companies(input_csv)
+        print(f"Found {total_companies} companies in {input_csv}")
     except Exception as e:
         print(f"Error reading CSV file {input_csv}: {e}")
         return
@@ -789,16 +1288,16 @@ async def process_consolidated_csv(input_csv: str, output_csv: str = 'european_s
             print("Starting from the beginning...")
             existing_processed = set()
     
-    # Filter out already processed websites if resuming
+    # Recount without the already processed websites if resuming
     if existing_processed:
-        companies = [c for c in companies if c.get('website_url') not in existing_processed]
+        total_companies = count_input_companies(input_csv, existing_processed)
     
-    total_companies = len(companies)
     if total_companies == 0:
         print("No companies to process!")
         return
     
-    # Create the output CSV file and write header
+    # Create the output CSV file and write header.
+    # Rows are written (and flushed) in batches by a single writer task, see write_rows.
     mode = 'a' if existing_processed and os.path.exists(output_csv) else 'w'
     csvfile = open(output_csv, mode, newline='', encoding='utf-8')
     fieldnames = ['name', 'country', 'eu_startups_url', 'website_url', 'emails']
@@ -815,51 +1314,83 @@ async def process_consolidated_csv(input_csv: str, output_csv: str = 'european_s
         'error_count': 0,
         'skip_count': 0,
         'processed_count': 0,
-        'active_workers': 0,
-        'csv_lock': asyncio.Lock()  # Lock for thread-safe CSV writing
+        'active_workers': 0
     }
     
+    # Workers hand finished rows to one writer task, so the CSV needs no lock
+    write_queue = asyncio.Queue()
+    writer_task = asyncio.create_task(write_rows(write_queue, writer, csvfile))
+    # Set once the workers are finished so the progress updater exits on its own
+    done_event = asyncio.Event()
+    
     # Process companies with worker pool
     try:
-        # Limit number of workers to reasonable values
+        # Limit number of workers to reasonable values; each one may hold a browser page
         workers = max(1, min(workers, 20))  # Between 1 and 20 workers
-        print(f"Starting processing with {workers} concurrent workers")
+        print(f"Starting processing with up to {workers} concurrent workers")
+        
+        # How many workers actually crawl at once backs off on timeouts and rate limiting, up to the number of workers
+        limiter = AdaptiveLimiter(workers, initial_limit=min(workers, ADAPTIVE_INITIAL_WORKERS))
+        
+        # Build the crawler configuration once and share it between workers
+        browser_config = get_browser_config()
+        llm_strategy = get_llm_strategy()
         
         # Start the progress updater task
-        progress_task = asyncio.create_task(update_progress(stats, total_companies, start_time))
+        progress_task = asyncio.create_task(update_progress(stats, total_companies, start_time, done_event))
         
-        # Create a queue of companies to process
-        queue = asyncio.Queue()
-        for company in companies:
-            await queue.put(company)
+        # Bounded queue: the producer reads the input only as fast as workers consume it
+        queue = asyncio.Queue(maxsize=workers * 4)
         
-        # Define worker function
-        async def worker():
-            stats['active_workers'] += 1
+        async def producer():
             try:
-                while not queue.empty():
-                    company = await queue.get()
-                    await process_company(company, writer, stats)
-                    stats['processed_count'] += 1
-                    queue.task_done()
+                with open(input_csv, 'r', encoding='utf-8') as file:
+                    for company in csv.DictReader(file):
+                        if company.get('website_url') in existing_processed:
+                            continue
+                        await queue.put(company)
             finally:
-                stats['active_workers'] -= 1
+                # One sentinel per worker tells it there is nothing left to process
+                for _ in range(workers):
+                    await queue.put(None)
         
-        # Start workers
-        worker_tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+        # Define worker function
+        async def worker(session_id):
+            while True:
+                company = await queue.get()
+                if company is None:
+                    queue.task_done()
+                    break
+                
+                await limiter.acquire()
+                stats['active_workers'] += 1
+                success = False
+                try:
+                    success = await process_company(company, write_queue, stats, crawler, session_id, llm_strategy)
+                finally:
+                    stats['active_workers'] -= 1
+                    await limiter.release(success)
+                stats['processed_count'] += 1
+                queue.task_done()
         
-        # Wait for all work to complete
-        await asyncio.gather(*worker_tasks)
+        # Start one browser shared by all workers; each worker crawls in its own session
+        async with AsyncWebCrawler(config=browser_config) as crawler:
+            producer_task = asyncio.create_task(producer())
+            worker_tasks = [asyncio.create_task(worker(f"email_worker_{n}")) for n in range(workers)]
+            
+            # Wait for all work to complete, then let the writer drain the remaining rows
+            await asyncio.gather(producer_task, *worker_tasks)
+        await write_queue.put(None)
+        await writer_task
         
-        # Cancel the progress updater
-        progress_task.cancel()
-        try:
-            await progress_task
-        except asyncio.CancelledError:
-            pass
+        # Let the progress updater finish
+        done_event.set()
+        await progress_task
         
     finally:
-        # Always close the CSV file
+        # Always stop the writer and progress updater, and close the CSV file
+        done_event.set()
+        writer_task.cancel()
         csvfile.close()
     
     # Print final statistics
@@ -888,28 +1419,39 @@ async def main():
     parser.add_argument("--website", type=str, help="Direct website URL to process (single mode)")
     parser.add_argument("--company", type=str, help="SeedTable company ID to process (single mode)")
     parser.add_argument("--workers", type=int, default=1, 
-                        help="Number of concurrent workers (default: 1, recommended: 5-10 for faster processing)")
+                        help="Maximum number of concurrent workers; the actual concurrency adapts to failures (default: 1, recommended: 5-10 for faster processing)")
+    parser.add_argument("--cache", type=str, default="email_cache.sqlite3",
+                        help="SQLite file caching the emails and contact links found per page between runs (default: email_cache.sqlite3)")
+    parser.add_argument("--force-rescrape", action="store_true",
+                        help="Crawl every page again instead of using cached results")
     args = parser.parse_args()
     
-    if args.website:
-        print("=" * 80)
-        print(f"PROCESSING SINGLE WEBSITE: {args.website}")
-        print("=" * 80)
-        await crawl_for_contact_email(website_url=args.website)
+    global email_cache
+    email_cache = EmailCache(args.cache, force_rescrape=args.force_rescrape)
+    
+    try:
+        if args.website:
+            print("=" * 80)
+            print(f"PROCESSING SINGLE WEBSITE: {args.website}")
+            print("=" * 80)
+            await crawl_for_contact_email(website_url=args.website)
         
-    elif args.company:
-        print("=" * 80)
-        print(f"PROCESSING SEEDTABLE COMPANY: {args.company}")
-        print("=" * 80)
-        await crawl_for_contact_email(seedtable_company_id=args.company)
+        elif args.company:
+            print("=" * 80)
+            print(f"PROCESSING SEEDTABLE COMPANY: {args.company}")
+            print("=" * 80)
+            await crawl_for_contact_email(seedtable_company_id=args.company)
         
-    else:
-        print("=" * 80)
-        print(f"PROCESSING CONSOLIDATED CSV FILE: {args.input}")
-        print(f"OUTPUT WILL BE SAVED TO: {args.output}")
-        print(f"USING {args.workers} CONCURRENT WORKERS")
-        print("=" * 80)
-        await process_consolidated_csv(args.input, output_csv=args.output, workers=args.workers)
+        else:
+            print("=" * 80)
+            print(f"PROCESSING CONSOLIDATED CSV FILE: {args.input}")
+            print(f"OUTPUT WILL BE SAVED TO: {args.output}")
+            print(f"USING {args.workers} CONCURRENT WORKERS")
+            print("=" * 80)
+            await process_consolidated_csv(args.input, output_csv=args.output, workers=args.workers)
+    finally:
+        await close_session()
+        email_cache.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
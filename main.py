@@ -1,9 +1,8 @@
-import asyncio
-
 from crawl4ai import AsyncWebCrawler
 from dotenv import load_dotenv
 
 from config import BASE_URL, CSS_SELECTOR, REQUIRED_KEYS
+from utils.concurrency_utils import HostRateLimiter, run
 from utils.data_utils import (
     save_venues_to_csv,
 )
@@ -15,6 +14,9 @@ from utils.scraper_utils import (
 
 load_dotenv()
 
+# Minimum number of seconds between two page requests, to be polite and avoid rate limits
+PAGE_INTERVAL = 2
+
 
 async def crawl_venues():
     """
@@ -29,11 +31,15 @@ async def crawl_venues():
     page_number = 1
     all_venues = []
     seen_names = set()
+    rate_limiter = HostRateLimiter(PAGE_INTERVAL)
 
     # Start the web crawler context
     # https://docs.crawl4ai.com/api/async-webcrawler/#asyncwebcrawler
     async with AsyncWebCrawler(config=browser_config) as crawler:
         while True:
+            # Wait out whatever is left of the interval since the previous page was requested
+            await rate_limiter.acquire(BASE_URL)
+
             # Fetch and process data from the current page
             venues, no_results_found = await fetch_and_process_page(
                 crawler,
@@ -58,9 +64,6 @@ async def crawl_venues():
             all_venues.extend(venues)
             page_number += 1  # Move to the next page
 
-            # Pause between requests to be polite and avoid rate limits
-            await asyncio.sleep(2)  # Adjust sleep time as needed
-
     # Save the collected venues to a CSV file
     if all_venues:
         save_venues_to_csv(all_venues, "complete_venues.csv")
@@ -80,4 +83,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
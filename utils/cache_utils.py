@@ -0,0 +1,77 @@
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+# Pages scanned within this window are served from the cache instead of being crawled again
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class EmailCache:
+    """
+    SQLite-backed cache of what was found on each crawled page (emails and contact links),
+    kept between runs.
+
+    The table is keyed by URL (primary key), so a lookup replaces the browser page loads
+    for both the email scan and the contact-link extraction of that page.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = DEFAULT_TTL_SECONDS, force_rescrape: bool = False):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl_seconds: Age after which a cached page is crawled again
+            force_rescrape: Ignore existing entries but keep recording new results
+        """
+        self.ttl_seconds = ttl_seconds
+        self.force_rescrape = force_rescrape
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS page_results ("
+            "url TEXT PRIMARY KEY, result TEXT NOT NULL, scraped_at INTEGER NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the result recorded for a page.
+
+        Args:
+            url: The page URL
+
+        Returns:
+            The cached page result ('emails', 'links' and 'mailto' lists; the last two are None
+            when the links were not extracted), or None if the page is missing, expired or
+            rescraping is forced
+        """
+        if self.force_rescrape:
+            return None
+
+        row = self.connection.execute(
+            "SELECT result, scraped_at FROM page_results WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def put(self, url: str, result: Dict[str, Any]) -> None:
+        """
+        Record the result of a page, replacing any older entry.
+
+        Args:
+            url: The page URL
+            result: The page result ('emails', 'links' and 'mailto' lists, possibly empty; the
+                last two are None when the links were not extracted)
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO page_results (url, result, scraped_at) VALUES (?, ?, ?)",
+            (url, json.dumps(result), int(time.time())),
+        )
+        # Commit per page so results survive an interrupted run
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
@@ -0,0 +1,127 @@
+import asyncio
+import urllib.parse
+from typing import Any, Coroutine, Dict
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for crawling: it grows by one slot after a full window of
+    successful tasks and is halved whenever a task fails.
+
+    Failures are usually timeouts or rate limiting, so backing off quickly keeps the run
+    from hammering slow sites, while the slow additive growth finds the useful concurrency.
+    """
+
+    def __init__(self, max_limit: int, initial_limit: int = 1):
+        """
+        Create the limiter.
+
+        Args:
+            max_limit: Upper bound for the concurrency limit
+            initial_limit: Limit to start from (clamped to 1..max_limit)
+        """
+        self.max_limit = max(1, max_limit)
+        self.limit = max(1, min(initial_limit, self.max_limit))
+        self.active = 0
+        self.successes = 0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self, success: bool) -> None:
+        """
+        Give a slot back and adjust the limit.
+
+        Args:
+            success: Whether the task finished without an error
+        """
+        async with self.condition:
+            self.active -= 1
+            if success:
+                self.successes += 1
+                # One extra slot per window of `limit` successes (additive increase)
+                if self.successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self.successes = 0
+            else:
+                # Multiplicative decrease on failure
+                self.limit = max(1, self.limit // 2)
+                self.successes = 0
+            self.condition.notify_all()
+
+
+class HostRateLimiter:
+    """
+    Spaces out requests to the same host by a minimum interval.
+
+    Unlike a fixed sleep after every request, time already spent processing a page counts
+    towards the interval, and requests to different hosts never wait on each other.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Create the limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between two requests to one host
+        """
+        self.min_interval = min_interval
+        self.next_allowed: Dict[str, float] = {}
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, url: str) -> None:
+        """
+        Wait until a request to the URL's host is allowed and reserve that slot.
+
+        Args:
+            url: The URL about to be requested
+        """
+        host = urllib.parse.urlparse(url).netloc
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            now = loop.time()
+            start = max(now, self.next_allowed.get(host, now))
+            self.next_allowed[host] = start + self.min_interval
+        await asyncio.sleep(start - now)
+
+
+def make_session_pool(size: int, prefix: str = "email_finder_session") -> "asyncio.Queue[str]":
+    """
+    Create a pool of crawler session ids.
+
+    Each concurrent task takes an id from the pool and puts it back when done, so no two
+    crawls share a browser page and the pool size caps how many tasks run at once.
+
+    Args:
+        size: Number of session ids in the pool
+        prefix: Prefix of the generated session ids
+
+    Returns:
+        A queue holding the session ids
+    """
+    session_ids: "asyncio.Queue[str]" = asyncio.Queue()
+    for n in range(size):
+        session_ids.put_nowait(f"{prefix}_{n}")
+    return session_ids
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a script's main coroutine, on uvloop when it is installed.
+
+    Args:
+        main: The coroutine to run
+
+    Returns:
+        The result of the coroutine
+    """
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows, fall back to the default event loop
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -2,6 +2,12 @@ import csv
 
 from models.venue import Venue
 
+# CSV column order, taken from the Venue model once at import time
+VENUE_FIELDNAMES = tuple(Venue.model_fields)
+
+# Write buffer for the venues CSV, so large outputs go to disk in few system calls
+CSV_WRITE_BUFFER = 1 << 20
+
 
 def is_duplicate_venue(venue_name: str, seen_names: set) -> bool:
     return venue_name in seen_names
@@ -16,11 +22,8 @@ def save_venues_to_csv(venues: list, filename: str):
         print("No venues to save.")
         return
 
-    # Use field names from the Venue model
-    fieldnames = Venue.model_fields.keys()
-
-    with open(filename, mode="w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
+    with open(filename, mode="w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as file:
+        writer = csv.DictWriter(file, fieldnames=VENUE_FIELDNAMES)
         writer.writeheader()
         writer.writerows(venues)
     print(f"Saved {len(venues)} venues to '{filename}'.")
@@ -1,6 +1,7 @@
+import functools
 import json
 import os
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 
 from crawl4ai import (
     AsyncWebCrawler,
@@ -13,10 +14,14 @@ from crawl4ai import (
 from models.venue import Venue
 from utils.data_utils import is_complete_venue, is_duplicate_venue
 
+# JSON schema of the Venue model, generated once at import time
+VENUE_SCHEMA = Venue.model_json_schema()
 
+
+@functools.lru_cache(maxsize=1)
 def get_browser_config() -> BrowserConfig:
     """
-    Returns the browser configuration for the crawler.
+    Returns the browser configuration for the crawler, built once per process.
 
     Returns:
         BrowserConfig: The configuration settings for the browser.
@@ -29,9 +34,10 @@ def get_browser_config() -> BrowserConfig:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm_strategy() -> LLMExtractionStrategy:
     """
-    Returns the configuration for the language model extraction strategy.
+    Returns the configuration for the language model extraction strategy, built once per process.
 
     Returns:
         LLMExtractionStrategy: The settings for how to extract data using LLM.
@@ -40,7 +46,7 @@ def get_llm_strategy() -> LLMExtractionStrategy:
     return LLMExtractionStrategy(
         provider="groq/deepseek-r1-distill-llama-70b",  # Name of the LLM provider
         api_token=os.getenv("GROQ_API_KEY"),  # API token for authentication
-        schema=Venue.model_json_schema(),  # JSON schema of the data model
+        schema=VENUE_SCHEMA,  # JSON schema of the data model
         extraction_type="schema",  # Type of extraction to perform
         instruction=(
             "Extract all venue objects with 'name', 'location', 'price', 'capacity', "
@@ -56,7 +62,7 @@ async def check_no_results(
     crawler: AsyncWebCrawler,
     url: str,
     session_id: str,
-) -> bool:
+) -> Tuple[bool, Optional[str]]:
     """
     Checks if the "No Results Found" message is present on the page.
 
@@ -66,7 +72,9 @@ async def check_no_results(
         session_id (str): The session identifier.
 
     Returns:
-        bool: True if "No Results Found" message is found, False otherwise.
+        Tuple[bool, Optional[str]]:
+            - bool: True if "No Results Found" message is found, False otherwise.
+            - Optional[str]: The fetched HTML, or None if the page could not be loaded.
     """
     # Fetch the page without any CSS selector or extraction strategy
     result = await crawler.arun(
@@ -79,13 +87,13 @@ async def check_no_results(
 
     if result.success:
         if "No Results Found" in result.cleaned_html:
-            return True
-    else:
-        print(
-            f"Error fetching page for 'No Results Found' check: {result.error_message}"
-        )
+            return True, result.html
+        return False, result.html
 
-    return False
+    print(
+        f"Error fetching page for 'No Results Found' check: {result.error_message}"
+    )
+    return False, None
 
 
 async def fetch_and_process_page(
@@ -120,13 +128,13 @@ async def fetch_and_process_page(
     print(f"Loading page {page_number}...")
 
     # Check if "No Results Found" message is present
-    no_results = await check_no_results(crawler, url, session_id)
+    no_results, page_html = await check_no_results(crawler, url, session_id)
     if no_results:
         return [], True  # No more results, signal to stop crawling
 
-    # Fetch page content with the extraction strategy
+    # Run the extraction on the HTML fetched above instead of loading the page again
     result = await crawler.arun(
-        url=url,
+        url=f"raw:{page_html}" if page_html else url,
         config=CrawlerRunConfig(
             cache_mode=CacheMode.BYPASS,  # Do not use cached data
             extraction_strategy=llm_strategy,  # Strategy for data extraction